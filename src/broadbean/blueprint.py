@@ -2,6 +2,7 @@
 
 import functools as ft
 import json
+import os
 import re
 import warnings
 from inspect import signature
@@ -15,6 +16,16 @@ class SegmentDurationError(Exception):
     pass
 
 
+@ft.lru_cache(maxsize=256)
+def _parameter_names(function) -> tuple[str, ...]:
+    """
+    Returns the names of the arguments of a segment function. The result
+    is cached, since inspecting the signature is slow and the same few
+    functions are used over and over.
+    """
+    return tuple(signature(function).parameters)
+
+
 class BluePrint:
     """
     The class of a waveform to become.
@@ -162,17 +173,17 @@ class BluePrint:
         if not isinstance(lst, list):
             raise ValueError(f"_make_names_unique received a non-list input! Got {lst}")
 
-        baselst = [BluePrint._basename(lstel) for lstel in lst]
-        uns = np.unique(baselst)
+        # a single pass, counting the occurences of each basename so far
+        counts: dict[str, int] = {}
 
-        for un in uns:
-            inds = [ii for ii, el in enumerate(baselst) if el == un]
-            for ii, ind in enumerate(inds):
-                # Do not append numbers to the first occurence
-                if ii == 0:
-                    lst[ind] = f"{un}"
-                else:
-                    lst[ind] = f"{un}{ii + 1}"
+        for ind, lstel in enumerate(lst):
+            un = BluePrint._basename(lstel)
+            counts[un] = counts.get(un, 0) + 1
+            # Do not append numbers to the first occurence
+            if counts[un] == 1:
+                lst[ind] = un
+            else:
+                lst[ind] = f"{un}{counts[un]}"
 
         return lst
 
@@ -266,10 +277,8 @@ class BluePrint:
             if desc[segkey]["function"] == "waituntil":
                 desc[segkey]["arguments"] = {"waittime": self._argslist[sn]}
             else:
-                sig = signature(self._funlist[sn])
-                desc[segkey]["arguments"] = dict(
-                    zip(sig.parameters, self._argslist[sn])
-                )
+                params = _parameter_names(self._funlist[sn])
+                desc[segkey]["arguments"] = dict(zip(params, self._argslist[sn]))
 
         desc["marker1_abs"] = self.marker1
         desc["marker2_abs"] = self.marker2
@@ -278,7 +287,7 @@ class BluePrint:
 
         return desc
 
-    def write_to_json(self, path_to_file: str) -> None:
+    def write_to_json(self, path_to_file: str | os.PathLike) -> None:
         """
         Writes blueprint to JSON file
 
@@ -332,7 +341,7 @@ class BluePrint:
         return bp_sum
 
     @classmethod
-    def init_from_json(cls, path_to_file: str) -> "BluePrint":
+    def init_from_json(cls, path_to_file: str | os.PathLike) -> "BluePrint":
         """
         Reads blueprint from JSON file
 
@@ -453,18 +462,18 @@ class BluePrint:
         for name in replacelist:
             position = self._namelist.index(name)
             function = self._funlist[position]
-            sig = signature(function)
+            params = _parameter_names(function)
 
             # Validation
             if isinstance(arg, str):
-                if arg not in sig.parameters:
+                if arg not in params:
                     raise ValueError(
                         "No such argument of function "
                         f"{function.__name__}. Has arguments "
-                        f"{sig.parameters.keys()}."
+                        f"{params}."
                     )
             # Each function has two 'secret' arguments, SR and dur
-            user_params = len(sig.parameters) - 2
+            user_params = len(params) - 2
             if isinstance(arg, int) and (arg not in range(user_params)):
                 raise ValueError(
                     f"No argument {arg} "
@@ -479,10 +488,7 @@ class BluePrint:
                 value = (value,)
 
             if isinstance(arg, str):
-                for ii, param in enumerate(sig.parameters):
-                    if arg == param:
-                        arg = ii
-                        break
+                arg = params.index(arg)
 
             # Mutating the immutable...
             larg = list(self._argslist[position])
@@ -598,20 +604,21 @@ class BluePrint:
         Returns a copy of the BluePrint
         """
 
-        # Needed because of input validation in __init__
-        namelist = [self._basename(name) for name in self._namelist.copy()]
+        # The lists hold immutable items (functions, tuples, numbers), so
+        # shallow copies suffice and the validation in __init__ is skipped
+        new_bp = BluePrint()
 
-        return BluePrint(
-            self._funlist.copy(),
-            self._argslist.copy(),
-            namelist,
-            self.marker1.copy(),
-            self.marker2.copy(),
-            self._segmark1.copy(),
-            self._segmark2.copy(),
-            self._SR,
-            self._durslist,
-        )
+        new_bp._namelist = self._namelist.copy()
+        new_bp._funlist = self._funlist.copy()
+        new_bp._argslist = self._argslist.copy()
+        new_bp.marker1 = self.marker1.copy()
+        new_bp.marker2 = self.marker2.copy()
+        new_bp._segmark1 = self._segmark1.copy()
+        new_bp._segmark2 = self._segmark2.copy()
+        new_bp._durslist = self._durslist.copy()
+        new_bp._SR = self._SR
+
+        return new_bp
 
     def insertSegment(self, pos, func, args=(), dur=None, name=None, durs=None):
         """
@@ -761,6 +768,25 @@ class BluePrint:
 
         return new_bp
 
+    def _signature(self):
+        """
+        Returns a tuple of all the lists defining the BluePrint. Two
+        BluePrints are identical iff their signatures are.
+
+        The signature is computed on the fly, since the lists may be
+        mutated directly (e.g. by Element._applyDelays).
+        """
+        return (
+            self._namelist,
+            self._funlist,
+            self._argslist,
+            self._durslist,
+            self.marker1,
+            self.marker2,
+            self._segmark1,
+            self._segmark2,
+        )
+
     def __eq__(self, other):
         """
         Compare two blueprints. They are the same iff all
@@ -784,21 +810,7 @@ class BluePrint:
                              """
             )
 
-        if not self._namelist == other._namelist:
-            return False
-        if not self._funlist == other._funlist:
-            return False
-        if not self._argslist == other._argslist:
-            return False
-        if not self.marker1 == other.marker1:
-            return False
-        if not self.marker2 == other.marker2:
-            return False
-        if not self._segmark1 == other._segmark1:
-            return False
-        if not self._segmark2 == other._segmark2:
-            return False
-        return True
+        return self._signature() == other._signature()
 
 
 def _subelementBuilder(
@@ -858,31 +870,31 @@ def _subelementBuilder(
     # and raise an exception if the segment ends up with less than
     # two points
 
-    intdurations = np.zeros(len(newdurations), dtype=int)
-
-    for ii, dur in enumerate(newdurations):
-        int_dur = round(dur * SR)
-        if int_dur < 2:
-            raise SegmentDurationError(
-                "Too short segment detected! "
-                f'Segment "{namelist[ii]}" at position {ii} '
-                f"has a duration of {newdurations[ii]} which at "
-                f"an SR of {SR:.3E} leads to just {int_dur} "
-                "point(s). There must be at least "
-                "2 points in each segment."
-                ""
-            )
-        else:
-            intdurations[ii] = int_dur
-            newdurations[ii] = int_dur / SR
+    intdurations = np.round(newdurations * SR).astype(int)
+
+    too_short = np.flatnonzero(intdurations < 2)
+    if len(too_short) > 0:
+        ii = too_short[0]
+        raise SegmentDurationError(
+            "Too short segment detected! "
+            f'Segment "{namelist[ii]}" at position {ii} '
+            f"has a duration of {newdurations[ii]} which at "
+            f"an SR of {SR:.3E} leads to just {intdurations[ii]} "
+            "point(s). There must be at least "
+            "2 points in each segment."
+            ""
+        )
+
+    newdurations = intdurations / SR
 
     # The actual forging of the waveform
     wf_length = np.sum(intdurations)
     parts = [ft.partial(fun, *args) for (fun, args) in zip(funlist, argslist)]
-    blocks = [p(SR, d) for (p, d) in zip(parts, intdurations)]
-    output = np.fromiter(
-        (block for sl in blocks for block in sl), float, count=wf_length
-    )
+    # fill one preallocated array, segment by segment
+    output = np.empty(wf_length, dtype=float)
+    stops = np.cumsum(intdurations)
+    for p, d, stop in zip(parts, intdurations, stops):
+        output[stop - d : stop] = p(SR, d)
 
     # now make the markers
     time = np.linspace(0, sum(newdurations), wf_length, endpoint=False)
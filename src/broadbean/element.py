@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import json
+import os
 from collections.abc import Sequence
 from copy import deepcopy
 
@@ -117,9 +118,9 @@ class Element:
             SR: The sample rate in Sa/s
         """
 
+        # validate all arrays before touching whatever is on the channel
         N = len(waveform)
-        self._data[channel] = {}
-        self._data[channel]["array"] = {}
+        arrays = {}
 
         for name, array in kwargs.items():
             if len(array) != N:
@@ -127,9 +128,12 @@ class Element:
                     "Length mismatch between waveform and "
                     f"array {name}. Must be same length"
                 )
-            self._data[channel]["array"].update({name: array})
+            arrays[name] = array
+
+        arrays["wfm"] = waveform
 
-        self._data[channel]["array"]["wfm"] = waveform
+        self._data[channel] = {}
+        self._data[channel]["array"] = arrays
         self._data[channel]["SR"] = SR
 
     def validateDurations(self):
@@ -322,7 +326,7 @@ class Element:
 
         return desc
 
-    def write_to_json(self, path_to_file: str) -> None:
+    def write_to_json(self, path_to_file: str | os.PathLike) -> None:
         """
         Writes element to JSON file
 
@@ -350,7 +354,7 @@ class Element:
         return elem
 
     @classmethod
-    def init_from_json(cls, path_to_file: str) -> Element:
+    def init_from_json(cls, path_to_file: str | os.PathLike) -> Element:
         """
         Reads Element from JSON file
 
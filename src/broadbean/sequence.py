@@ -2,6 +2,7 @@
 # along with a few helpers
 import json
 import logging
+import os
 import warnings
 from copy import deepcopy
 from typing import Any, cast
@@ -97,14 +98,17 @@ class Sequence:
     def __eq__(self, other):
         if not isinstance(other, Sequence):
             return False
-        elif not self._data == other._data:
-            return False
-        elif not self._meta == other._meta:
+        # compare the cheap attributes first, the elements last
+        elif len(self._data) != len(other._data):
             return False
         elif not self._awgspecs == other._awgspecs:
             return False
         elif not self._sequencing == other._sequencing:
             return False
+        elif not self._meta == other._meta:
+            return False
+        elif not self._data == other._data:
+            return False
         else:
             return True
 
@@ -537,7 +541,7 @@ class Sequence:
         desc["awgspecs"] = self._awgspecs
         return desc
 
-    def write_to_json(self, path_to_file: str) -> None:
+    def write_to_json(self, path_to_file: str | os.PathLike) -> None:
         """
         Writes sequences to JSON file
 
@@ -599,7 +603,7 @@ class Sequence:
         return new_instance
 
     @classmethod
-    def init_from_json(cls, path_to_file: str) -> "Sequence":
+    def init_from_json(cls, path_to_file: str | os.PathLike) -> "Sequence":
         """
         Reads sequense from JSON file
 
@@ -1,3 +1,31 @@
+import pytest
 from hypothesis import settings
 
+import broadbean as bb
+
 settings.register_profile("ci", deadline=1000)
+
+
+@pytest.fixture(scope="session")
+def _blueprint_tophat_template():
+    """
+    Build the tophat blueprint once per session, see blueprint_tophat
+    """
+    ramp = bb.PulseAtoms.ramp
+
+    th = bb.BluePrint()
+    th.insertSegment(0, ramp, args=(0, 0), name="ramp", dur=1)
+    th.insertSegment(1, ramp, args=(1, 1), name="ramp", dur=0.5)
+    th.insertSegment(2, ramp, args=(0, 0), name="ramp", dur=1)
+    th.setSR(2000)
+
+    return th
+
+
+@pytest.fixture
+def blueprint_tophat(_blueprint_tophat_template):
+    """
+    Return a blueprint consisting of three slopeless ramps forming something
+    similar to a tophat
+    """
+    return _blueprint_tophat_template.copy()
@@ -15,7 +15,9 @@ sine = bb.PulseAtoms.sine
 
 @pytest.fixture
 def protosequence1():
-    SR = 1e9
+    # a modest sample rate keeps the forged arrays short; these tests check
+    # the structure of the AWG file package, not waveform fidelity
+    SR = 1e7
 
     th = bb.BluePrint()
     th.insertSegment(0, ramp, args=(0, 0), name="ramp", dur=10e-6)
@@ -24,11 +26,11 @@ def protosequence1():
     th.setSR(SR)
 
     wiggle1 = bb.BluePrint()
-    wiggle1.insertSegment(0, sine, args=(4e6, 0.5, 0, 0), dur=25e-6)
+    wiggle1.insertSegment(0, sine, args=(0.4e6, 0.5, 0, 0), dur=25e-6)
     wiggle1.setSR(SR)
 
     wiggle2 = bb.BluePrint()
-    wiggle2.insertSegment(0, sine, args=(8e6, 0.5, 0, 0), dur=25e-6)
+    wiggle2.insertSegment(0, sine, args=(0.8e6, 0.5, 0, 0), dur=25e-6)
     wiggle2.setSR(SR)
 
     elem1 = bb.Element()
@@ -12,6 +12,7 @@ import broadbean as bb
 ramp = bb.PulseAtoms.ramp
 sine = bb.PulseAtoms.sine
 
+# the sample rate of the blueprint_tophat fixture (see conftest.py)
 tophat_SR = 2000
 
 
@@ -23,21 +24,6 @@ def virgin_blueprint():
     return bb.BluePrint()
 
 
-@pytest.fixture
-def blueprint_tophat():
-    """
-    Return a blueprint consisting of three slopeless ramps forming something
-    similar to a tophat
-    """
-    th = bb.BluePrint()
-    th.insertSegment(0, ramp, args=(0, 0), name="ramp", dur=1)
-    th.insertSegment(1, ramp, args=(1, 1), name="ramp", dur=0.5)
-    th.insertSegment(2, ramp, args=(0, 0), name="ramp", dur=1)
-    th.setSR(tophat_SR)
-
-    return th
-
-
 @pytest.fixture
 def blueprint_nasty():
     """
@@ -149,7 +135,7 @@ def test_creation(virgin_blueprint):
     ],
 )
 def test_bare_init(virgin_blueprint, attribute, expected):
-    assert virgin_blueprint.__getattribute__(attribute) == expected
+    assert getattr(virgin_blueprint, attribute) == expected
 
 
 ##################################################
@@ -170,7 +156,7 @@ def test_bare_init(virgin_blueprint, attribute, expected):
     ],
 )
 def test_tophat_init(blueprint_tophat, attribute, val):
-    assert blueprint_tophat.__getattribute__(attribute) == val
+    assert getattr(blueprint_tophat, attribute) == val
 
 
 @pytest.mark.parametrize(
@@ -188,7 +174,7 @@ def test_tophat_init(blueprint_tophat, attribute, val):
 )
 def test_tophat_copy(blueprint_tophat, attribute, val):
     new_bp = blueprint_tophat.copy()
-    assert new_bp.__getattribute__(attribute) == val
+    assert getattr(new_bp, attribute) == val
 
 
 @pytest.mark.parametrize(
@@ -359,6 +345,11 @@ def test_not_equal(blueprint_tophat):
 
     assert (bpc == blueprint_tophat) is False
 
+    bpc = blueprint_tophat.copy()
+    bpc.changeDuration("ramp2", 0.25)
+
+    assert (bpc == blueprint_tophat) is False
+
 
 def test_add_two_identical(blueprint_tophat):
     bp = blueprint_tophat
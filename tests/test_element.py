@@ -3,8 +3,6 @@
 # We let the test_blueprint.py test the BluePrint and only test that Elements
 # work on the Element level
 
-import os
-
 import hypothesis.strategies as hst
 import numpy as np
 import pytest
@@ -15,22 +13,6 @@ from broadbean.element import Element, ElementDurationError
 
 ramp = bb.PulseAtoms.ramp
 sine = bb.PulseAtoms.sine
-tophat_SR = 2000
-
-
-@pytest.fixture(scope="function")
-def blueprint_tophat():
-    """
-    Return a blueprint consisting of three slopeless ramps forming something
-    similar to a tophat
-    """
-    th = bb.BluePrint()
-    th.insertSegment(0, ramp, args=(0, 0), name="ramp", dur=1)
-    th.insertSegment(1, ramp, args=(1, 1), name="ramp", dur=0.5)
-    th.insertSegment(2, ramp, args=(0, 0), name="ramp", dur=1)
-    th.setSR(tophat_SR)
-
-    return th
 
 
 @pytest.fixture
@@ -124,13 +106,22 @@ def test_addArray():
     with pytest.raises(ValueError):
         elem.addArray(2, wfm, SR, m2=m2[3:])
 
+    # a rejected array must leave the channel untouched
+    assert np.all(elem.getArrays()[1]["m1"] == m1)
+
+
+def test_copy_array_element():
+    elem = Element()
+    elem.addArray(1, [0, 0.5, 1, 0.5], 1e9, m1=[1, 0, 0, 0])
+    assert elem == elem.copy()
+
 
 @settings(max_examples=25, suppress_health_check=(HealthCheck.function_scoped_fixture,))
 @given(
     SR1=hst.integers(min_value=1, max_value=25 * 10**8),
     SR2=hst.integers(min_value=1, max_value=25 * 10**8),
-    N=hst.integers(min_value=2, max_value=25 * 10**6),
-    M=hst.integers(min_value=2, max_value=25 * 10**6),
+    N=hst.integers(min_value=2, max_value=10**5),
+    M=hst.integers(min_value=2, max_value=10**5),
 )
 def test_invalid_durations(SR1, SR2, N, M):
     """
@@ -221,9 +212,11 @@ def test_input_fail1(improper_bp):
 @settings(max_examples=25, suppress_health_check=(HealthCheck.function_scoped_fixture,))
 @given(
     SR=hst.integers(min_value=1, max_value=25 * 10**8),
-    N=hst.integers(min_value=2, max_value=25 * 10**6),
+    N=hst.integers(min_value=2, max_value=10**5),
 )
 def test_points(SR, N):
+    wfm = np.linspace(-1, 1, N)
+
     elem = Element()
 
     with pytest.raises(KeyError):
@@ -234,7 +227,6 @@ def test_points(SR, N):
     bp.insertSegment(0, ramp, (0, 0), dur=N / SR)
     bp.setSR(SR)
 
-    wfm = np.linspace(-1, 1, N)
     elem.addArray(1, wfm, SR)
     elem.addBluePrint(2, bp)
 
@@ -246,7 +238,6 @@ def test_points(SR, N):
     bp.insertSegment(0, ramp, (0, 0), dur=N / SR)
     bp.setSR(SR)
 
-    wfm = np.linspace(-1, 1, N)
     elem.addArray(2, wfm, SR)
     elem.addBluePrint(1, bp)
 
@@ -258,6 +249,6 @@ def test_write_read_element(blueprint_tophat, tmp_path):
     elem.addBluePrint(1, blueprint_tophat)
     d = tmp_path / "Element"
     d.mkdir()
-    elem.write_to_json(os.path.join(d, "ele.json"))
-    readback_elem = Element.init_from_json(os.path.join(d, "ele.json"))
+    elem.write_to_json(d / "ele.json")
+    readback_elem = Element.init_from_json(d / "ele.json")
     assert elem.description == readback_elem.description
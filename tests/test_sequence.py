@@ -5,8 +5,6 @@
 # The strategy is the same as for the BluePrint test suite: we cook up some
 # sequences and try to break them. If we can't, everything is prolly OK
 
-import os
-
 import numpy as np
 import pytest
 
@@ -22,7 +20,7 @@ ramp = bb.PulseAtoms.ramp
 sine = bb.PulseAtoms.sine
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def protosequence1():
     SR = 1e9
 
@@ -67,8 +65,12 @@ def protosequence1():
     return seq
 
 
-@pytest.fixture
-def protosequence2():
+@pytest.fixture(scope="module")
+def sawelements():
+    """
+    Return two elements holding a saw and a line-and-wiggle blueprint on
+    swapped channels
+    """
     SR = 1e9
 
     saw = bb.BluePrint()
@@ -89,6 +91,15 @@ def protosequence2():
     elem2.addBluePrint(2, saw)
     elem2.addBluePrint(1, lineandwiggle)
 
+    return elem1, elem2
+
+
+@pytest.fixture(scope="module")
+def protosequence2(sawelements):
+    SR = 1e9
+
+    elem1, elem2 = sawelements
+
     seq = Sequence()
     seq.setSR(SR)
     seq.addElement(1, elem1)
@@ -109,27 +120,11 @@ def protosequence2():
     return seq
 
 
-@pytest.fixture
-def badseq_missing_pos():
+@pytest.fixture(scope="module")
+def badseq_missing_pos(sawelements):
     SR = 1e9
 
-    saw = bb.BluePrint()
-    saw.insertSegment(0, ramp, args=(0, 100e-3), dur=11e-6)
-    saw.insertSegment(1, "waituntil", args=(25e-6))
-    saw.setSR(SR)
-
-    lineandwiggle = bb.BluePrint()
-    lineandwiggle.insertSegment(0, "waituntil", args=(11e-6))
-    lineandwiggle.insertSegment(1, sine, args=(10e6, 50e-6, 10e-6), dur=14e-6)
-    lineandwiggle.setSR(SR)
-
-    elem1 = bb.Element()
-    elem1.addBluePrint(1, saw)
-    elem1.addBluePrint(2, lineandwiggle)
-
-    elem2 = bb.Element()
-    elem2.addBluePrint(2, saw)
-    elem2.addBluePrint(1, lineandwiggle)
+    elem1, elem2 = sawelements
 
     seq = Sequence()
     seq.setSR(SR)
@@ -150,7 +145,7 @@ def badseq_missing_pos():
     return seq
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def squarepulse_baseelem():
     SR = 1e6
 
@@ -166,6 +161,50 @@ def squarepulse_baseelem():
     return baseelem
 
 
+@pytest.fixture(scope="module")
+def protosequence2_matched(protosequence2):
+    """
+    Return a copy of protosequence2 with channel settings matching those
+    of protosequence1, so that the two can be added
+    """
+    seq = protosequence2.copy()
+    seq.setChannelAmplitude(1, 2)
+    seq.setChannelOffset(1, 0)
+    seq.setChannelAmplitude(2, 2)
+    seq.setChannelOffset(2, 0)
+
+    return seq
+
+
+@pytest.fixture(scope="module")
+def merged_seq(protosequence1, protosequence2_matched):
+    """
+    Return protosequence1 + protosequence2 (with matched channel settings)
+    """
+    return protosequence1 + protosequence2_matched
+
+
+@pytest.fixture(scope="module")
+def merged_seq_reversed(protosequence1, protosequence2_matched):
+    """
+    Return protosequence2 (with matched channel settings) + protosequence1
+    """
+    return protosequence2_matched + protosequence1
+
+
+@pytest.fixture(scope="module")
+def varying_seq(squarepulse_baseelem):
+    """
+    Return a sequence varying the square pulse height over 1, 1.2, 1.3
+    """
+    channels = [1, 1]
+    names = ["varyme", "varyme"]
+    args = ["start", "stop"]
+    iters = 2 * [[1, 1.2, 1.3]]
+
+    return makeVaryingSequence(squarepulse_baseelem, channels, names, args, iters)
+
+
 ##################################################
 # Generate sequences
 
@@ -199,36 +238,45 @@ def test_generate_arbitrary_waveform():
 )
 def test_copy_positively(protosequence1, attribute):
     new_seq = protosequence1.copy()
-    attr1 = new_seq.__getattribute__(attribute)
-    attr2 = protosequence1.__getattribute__(attribute)
+    attr1 = getattr(new_seq, attribute)
+    attr2 = getattr(protosequence1, attribute)
+    assert attr1 is not attr2
     assert attr1 == attr2
 
 
-def test_copy_negatively_01(protosequence1):
-    new_seq = protosequence1.copy()
-    new_seq.setSequencingTriggerWait(1, 0)
-    new_seq.setSequencingNumberOfRepetitions(1, 1)
-    new_seq.setSequencingEventJumpTarget(1, 1)
-    new_seq.setSequencingGoto(1, 1)
+def _change_sequencing(seq):
+    seq.setSequencingTriggerWait(1, 0)
+    seq.setSequencingNumberOfRepetitions(1, 1)
+    seq.setSequencingEventJumpTarget(1, 1)
+    seq.setSequencingGoto(1, 1)
 
-    assert new_seq != protosequence1
 
+def _change_amplitude(seq):
+    seq.setChannelAmplitude(1, 1.9)
 
-def test_copy_negatively_02(protosequence1):
-    new_seq = protosequence1.copy()
-    new_seq.setChannelAmplitude(1, 1.9)
-    assert new_seq != protosequence1
 
+def _change_element(seq):
+    seq.element(1).changeArg(2, "sine", "freq", 1e6)
 
-def test_copy_negatively_03(protosequence1):
-    new_seq = protosequence1.copy()
-    new_seq.element(1).changeArg(2, "sine", "freq", 1e6)
-    assert new_seq != protosequence1
 
+def _change_nothing(seq):
+    pass
 
-def test_copy_and_eq(protosequence1):
+
+@pytest.mark.parametrize(
+    "mutate, equal",
+    [
+        (_change_sequencing, False),
+        (_change_amplitude, False),
+        (_change_element, False),
+        (_change_nothing, True),
+    ],
+    ids=["sequencing", "amplitude", "element", "unchanged"],
+)
+def test_copy_and_eq(protosequence1, mutate, equal):
     new_seq = protosequence1.copy()
-    assert new_seq == protosequence1
+    mutate(new_seq)
+    assert (new_seq == protosequence1) is equal
 
 
 def test_addition_fail_vrange(protosequence1, protosequence2):
@@ -241,62 +289,38 @@ def test_addition_fail_position(protosequence1, badseq_missing_pos):
         protosequence1 + badseq_missing_pos
 
 
-def test_addition_data(protosequence1, protosequence2):
-    protosequence2.setChannelAmplitude(1, 2)
-    protosequence2.setChannelOffset(1, 0)
-    protosequence2.setChannelAmplitude(2, 2)
-    protosequence2.setChannelOffset(2, 0)
-    newseq = protosequence1 + protosequence2
+def test_addition_data(protosequence1, protosequence2_matched, merged_seq):
     expected_data = {
         1: protosequence1.element(1),
         2: protosequence1.element(2),
-        3: protosequence2.element(1),
-        4: protosequence2.element(2),
+        3: protosequence2_matched.element(1),
+        4: protosequence2_matched.element(2),
     }
-    assert newseq._data == expected_data
-
+    assert merged_seq._data == expected_data
 
-def test_addition_sequencing1(protosequence1, protosequence2):
-    protosequence2.setChannelAmplitude(1, 2)
-    protosequence2.setChannelOffset(1, 0)
-    protosequence2.setChannelAmplitude(2, 2)
-    protosequence2.setChannelOffset(2, 0)
 
-    newseq = protosequence1 + protosequence2
+def test_addition_sequencing1(merged_seq):
     expected_sequencing = {
         1: {"twait": 1, "nrep": 1, "jump_target": 1, "goto": 1, "jump_input": 0},
         2: {"twait": 1, "nrep": 1, "jump_target": 1, "goto": 1, "jump_input": 0},
         3: {"twait": 0, "nrep": 2, "jump_target": 0, "goto": 4, "jump_input": 0},
         4: {"twait": 1, "nrep": 1, "jump_target": 0, "goto": 3, "jump_input": 0},
     }
-    assert newseq._sequencing == expected_sequencing
+    assert merged_seq._sequencing == expected_sequencing
 
 
-def test_addition_sequencing2(protosequence1, protosequence2):
-    protosequence2.setChannelAmplitude(1, 2)
-    protosequence2.setChannelOffset(1, 0)
-    protosequence2.setChannelAmplitude(2, 2)
-    protosequence2.setChannelOffset(2, 0)
-
-    newseq = protosequence2 + protosequence1
+def test_addition_sequencing2(merged_seq_reversed):
     expected_sequencing = {
         3: {"twait": 1, "nrep": 1, "jump_target": 3, "goto": 3, "jump_input": 0},
         4: {"twait": 1, "nrep": 1, "jump_target": 3, "goto": 3, "jump_input": 0},
         1: {"twait": 0, "nrep": 2, "jump_target": 0, "goto": 2, "jump_input": 0},
         2: {"twait": 1, "nrep": 1, "jump_target": 0, "goto": 1, "jump_input": 0},
     }
-    assert newseq._sequencing == expected_sequencing
+    assert merged_seq_reversed._sequencing == expected_sequencing
 
 
-def test_addition_awgspecs(protosequence1, protosequence2):
-    protosequence2.setChannelAmplitude(1, 2)
-    protosequence2.setChannelOffset(1, 0)
-    protosequence2.setChannelAmplitude(2, 2)
-    protosequence2.setChannelOffset(2, 0)
-
-    newseq = protosequence1 + protosequence2
-
-    assert newseq._awgspecs == protosequence1._awgspecs
+def test_addition_awgspecs(protosequence1, merged_seq):
+    assert merged_seq._awgspecs == protosequence1._awgspecs
 
 
 def test_addition_data_with_empty(protosequence1):
@@ -348,8 +372,9 @@ def test_duration(protosequence1, protosequence2):
 
 
 def test_setSR(protosequence1):
-    protosequence1.setSR(1.2e9)
-    assert protosequence1._awgspecs["SR"] == 1.2e9
+    seq = protosequence1.copy()
+    seq.setSR(1.2e9)
+    assert seq._awgspecs["SR"] == 1.2e9
 
 
 ##################################################
@@ -377,13 +402,8 @@ def test_makeVaryingSequence_fail(squarepulse_baseelem, channels, names, args, i
         (3, [(0, 0), 2 * (1.3,), (5e-4,)]),
     ],
 )
-def test_makeVaryingSequence(squarepulse_baseelem, seqpos, argslist):
-    channels = [1, 1]
-    names = ["varyme", "varyme"]
-    args = ["start", "stop"]
-    iters = 2 * [[1, 1.2, 1.3]]
-    sequence = makeVaryingSequence(squarepulse_baseelem, channels, names, args, iters)
-    assert sequence._data[seqpos]._data[1]["blueprint"]._argslist == argslist
+def test_makeVaryingSequence(varying_seq, seqpos, argslist):
+    assert varying_seq._data[seqpos]._data[1]["blueprint"]._argslist == argslist
 
 
 def test_repeatAndVarySequence_length(protosequence1):
@@ -435,10 +455,9 @@ def test_repeatAndVarySequence_fail_inputlength2(protosequence1):
 
 
 def test_repeatAndVarySequence_fail_consistency(protosequence1, squarepulse_baseelem):
+    protosequence1 = protosequence1.copy()
     protosequence1.addElement(5, squarepulse_baseelem)
 
-    print(protosequence1.checkConsistency())
-
     poss = (1,)
     channels = [1]
     names = ["ramp"]
@@ -464,7 +483,7 @@ def test_repeatAndVarySequence_same_elements(protosequence1, pos):
 def test_write_read_sequence(protosequence1, protosequence2, tmp_path):
     d = tmp_path / "Sequence"
     d.mkdir()
-    for seq in (protosequence1, protosequence2):
-        seq.write_to_json(os.path.join(d, "Seq.json"))
-        readbackseq = Sequence.init_from_json(os.path.join(d, "Seq.json"))
+    for seq, path in zip((protosequence1, protosequence2), ("Seq1.json", "Seq2.json")):
+        seq.write_to_json(d / path)
+        readbackseq = Sequence.init_from_json(d / path)
         assert seq == readbackseq
@@ -15,15 +15,16 @@ SR1 = 1e9
 
 forged_sequence_schema = fs_schema
 
+# fixed noise traces for the noise_element fixture
+NOISE = np.random.default_rng(0).standard_normal((3, 250))
 
-@pytest.fixture
-def subseq1():
+
+def make_subseq_elements(longdur):
     """
-    A small sequence meant to be used as a subsequence
+    Return a short wait element and a wiggle/slope/blob element of
+    duration longdur, the building blocks of the subsequence fixtures
     """
 
-    longdur = 201e-9
-
     wait = bb.BluePrint()
     wait.insertSegment(0, ramp, args=(0, 0), dur=10e-9)
     wait.setSR(SR1)
@@ -50,6 +51,16 @@ def subseq1():
     elem2.addBluePrint(2, slope)
     elem2.addBluePrint(3, blob)
 
+    return elem1, elem2
+
+
+@pytest.fixture(scope="module")
+def subseq1():
+    """
+    A small sequence meant to be used as a subsequence
+    """
+
+    elem1, elem2 = make_subseq_elements(longdur=201e-9)
     elem3 = elem1.copy()
 
     seq = Sequence()
@@ -63,39 +74,13 @@ def subseq1():
     return seq
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def subseq2():
     """
     A small sequence meant to be used as a subsequence
     """
 
-    longdur = 101e-9
-
-    wait = bb.BluePrint()
-    wait.insertSegment(0, ramp, args=(0, 0), dur=10e-9)
-    wait.setSR(SR1)
-
-    wiggle = bb.BluePrint()
-    wiggle.insertSegment(0, sine, args=(10e6, 10e-3, 0, 0), dur=longdur)
-    wiggle.setSR(SR1)
-
-    blob = bb.BluePrint()
-    blob.insertSegment(0, gauss, args=(25e-3, 12e-9, 0, 0), dur=longdur)
-    blob.setSR(SR1)
-
-    slope = bb.BluePrint()
-    slope.insertSegment(0, ramp, (0, 15e-3), dur=longdur)
-    slope.setSR(SR1)
-
-    elem1 = bb.Element()
-    elem1.addBluePrint(1, wait)
-    elem1.addBluePrint(2, wait)
-    elem1.addBluePrint(3, wait)
-
-    elem2 = bb.Element()
-    elem2.addBluePrint(1, wiggle)
-    elem2.addBluePrint(2, slope)
-    elem2.addBluePrint(3, blob)
+    elem1, elem2 = make_subseq_elements(longdur=101e-9)
 
     seq = Sequence()
     seq.setSR(SR1)
@@ -106,25 +91,21 @@ def subseq2():
     return seq
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def noise_element():
     """
     An element consisting of arrays of noise
     """
 
-    noise1 = np.random.randn(250)
-    noise2 = np.random.randn(250)
-    noise3 = np.random.randn(250)
-
     elem = bb.Element()
-    elem.addArray(1, noise1, SR=SR1)
-    elem.addArray(2, noise2, SR=SR1)
-    elem.addArray(3, noise3, SR=SR1)
+    elem.addArray(1, NOISE[0], SR=SR1)
+    elem.addArray(2, NOISE[1], SR=SR1)
+    elem.addArray(3, NOISE[2], SR=SR1)
 
     return elem
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def bp_element():
     dur = 100e-9
 
@@ -147,7 +128,7 @@ def bp_element():
     return elem
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def master_sequence(subseq1, subseq2, bp_element, noise_element):
     """
     A sequence with subsequences and elements, some elements